@@ -68,6 +68,7 @@ setup(
     package_data={
         "vimgym": [
             "data/lessons/*.yaml",
+            "data/lessons/*/*.md",
             "data/challenges/*.yaml", 
             "data/achievements/*.yaml",
             "data/templates/*",
@@ -0,0 +1,124 @@
+"""Tests for the shared learning module and lesson machinery."""
+
+import functools
+
+import pytest
+
+from vimgym.modules import base, module03_text_editing
+from vimgym.modules.base import Exercise, LearningModule, Lesson, clear_lesson_cache
+from vimgym.modules.module01_basics import Module01Basics
+from vimgym.modules.module02_movement import Module02Movement
+from vimgym.modules.module03_text_editing import Module03TextEditing
+from vimgym.modules.module04_search_replace import Module04SearchReplace
+
+
+@pytest.fixture
+def isolated_lesson_cache(monkeypatch):
+    """Swap in empty lesson caches so tests can clear them without side effects."""
+    for name in ("load_lesson", "load_lesson_specs", "load_lesson_text"):
+        fresh = functools.lru_cache(maxsize=None)(getattr(base, name).__wrapped__)
+        monkeypatch.setattr(base, name, fresh)
+        if hasattr(module03_text_editing, name):
+            monkeypatch.setattr(module03_text_editing, name, fresh)
+    for name in ("_HINT_TUPLES", "_VALIDATION_PARAMS"):
+        monkeypatch.setattr(base, name, dict(getattr(base, name)))
+
+
+@pytest.mark.parametrize("module_class", [
+    Module01Basics,
+    Module02Movement,
+    Module03TextEditing,
+    Module04SearchReplace,
+])
+def test_lessons_built_on_access_and_shared(module_class):
+    """Test lessons are built when requested and shared between instances."""
+    module = module_class()
+    module.initialize_content()
+    lesson_ids = module.list_lesson_ids()
+    assert lesson_ids
+    assert module._lesson_cache == {}
+    
+    lesson = module.get_lesson_by_id(lesson_ids[-1])
+    
+    assert lesson.id == lesson_ids[-1]
+    assert list(module._lesson_cache) == [lesson_ids[-1]]
+    assert module.get_lesson(len(lesson_ids) - 1) is lesson
+    assert module.get_lesson_by_id("missing") is None
+    
+    other = module_class()
+    other.initialize_content()
+    for first, second in zip(module.lessons, other.lessons):
+        assert first is second
+
+
+def test_legacy_expected_text_param_moves_to_field():
+    """Test expected_text given as a validation param fills the typed field."""
+    exercise = Exercise(
+        "legacy", "Legacy", "Old-style params", "Type it",
+        ("i",), validation_type="text_content",
+        validation_params={"expected_text": "  done  "}
+    )
+    
+    assert exercise.expected_text == "  done  "
+    assert exercise.normalized_expected_text == "done"
+    assert exercise.validation_params == {}
+
+
+def test_equal_hints_share_strings():
+    """Test equal hint strings from different exercises are one object."""
+    first = Exercise("a", "A", "", "", ("u",), hints=("".join(["Press ", "u"]),))
+    second = Exercise("b", "B", "", "", ("u",), hints=(" ".join(["Press", "u"]), "x"))
+    
+    assert first.hints[0] is second.hints[0]
+
+
+def test_clear_lesson_cache_rebuilds_lessons(isolated_lesson_cache):
+    """Test clearing the lesson cache makes new instances rebuild lessons."""
+    module = Module03TextEditing()
+    module.initialize_content()
+    lesson = module.get_lesson(4)
+    
+    clear_lesson_cache()
+    assert not base._HINT_TUPLES
+    assert not base._VALIDATION_PARAMS
+    
+    other = Module03TextEditing()
+    other.initialize_content()
+    
+    assert other.get_lesson(4) is not lesson
+    assert other.get_lesson(4).content == lesson.content
+
+
+def test_unknown_validation_type_fails_validation():
+    """Test bad validation types load but fail instead of raising."""
+    exercise = Exercise("odd", "Odd", "", "", ("x",), validation_type="telepathy")
+    
+    result = exercise.validate_completion(["x"], {})
+    
+    assert exercise.validation_type == "telepathy"
+    assert not result.passed
+    assert result.feedback == "Unknown validation type"
+
+
+class _BrokenModule(LearningModule):
+    """Module whose only lesson fails to build."""
+    
+    def __init__(self):
+        super().__init__("broken", "Broken", "A lesson that cannot load")
+    
+    def initialize_content(self) -> None:
+        self.add_lesson_factories({"broken_lesson": self._build})
+    
+    def _build(self) -> Lesson:
+        raise FileNotFoundError("broken_lesson_introduction.md")
+
+
+def test_failed_lesson_build_raises_again_on_retry():
+    """Test a factory that raises is kept, so later access reports the same error."""
+    module = _BrokenModule()
+    module.initialize_content()
+    
+    for _ in range(2):
+        with pytest.raises(FileNotFoundError):
+            module.get_lesson(0)
+    assert module.lesson_count == 1
@@ -0,0 +1,23 @@
+"""Tests for lesson import and export."""
+
+import yaml
+
+from vimgym.modules.base import Exercise, Lesson, LessonContent
+from vimgym.modules.content_manager import ContentManager
+
+
+def test_export_lesson_with_unknown_validation_type(tmp_path):
+    """Test lessons export validation types as strings, known or not."""
+    exercises = (
+        Exercise("known", "Known", "", "", ("x",), validation_type="text_content"),
+        Exercise("odd", "Odd", "", "", ("x",), validation_type="telepathy"),
+    )
+    lesson = Lesson("exported", LessonContent(
+        "Exported", "A lesson to export", ("Export it",), "Intro", "Do it", exercises
+    ))
+    path = tmp_path / "lesson.yaml"
+    
+    ContentManager(data_dir=tmp_path).export_lesson_to_yaml(lesson, path)
+    
+    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    assert [ex["validation_type"] for ex in data["exercises"]] == ["text_content", "telepathy"]
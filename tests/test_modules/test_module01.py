@@ -0,0 +1,18 @@
+"""Tests for Module 1 lesson construction."""
+
+from vimgym.modules.base import ValidationType
+from vimgym.modules.module01_basics import _LESSON_SPECS, Module01Basics
+
+
+def test_text_exercises_use_typed_expected_text():
+    """Test text exercises set expected_text directly, not as a legacy param."""
+    for spec in _LESSON_SPECS:
+        for exercise in spec["exercises"]:
+            assert "expected_text" not in exercise.get("validation_params", {})
+    
+    module = Module01Basics()
+    module.initialize_content()
+    exercise = module.get_exercise_by_id("insert_before")
+    
+    assert exercise.validation_type is ValidationType.TEXT_CONTENT
+    assert exercise.expected_text == "Hello World"
@@ -0,0 +1,32 @@
+"""Tests for Module 2 lesson construction."""
+
+import pytest
+
+from vimgym.modules.module02_movement import Module02Movement
+
+
+@pytest.fixture
+def module():
+    """Create an initialized Module 2 instance."""
+    module = Module02Movement()
+    module.initialize_content()
+    return module
+
+
+def test_lesson_ids_listed_without_building(module):
+    """Test lesson IDs are known before any lesson is built."""
+    assert module.list_lesson_ids() == [
+        "lesson_02_01", "lesson_02_02", "lesson_02_03", "lesson_02_04"
+    ]
+    assert module.lesson_count == 4
+    assert module._lesson_cache == {}
+
+
+def test_cursor_exercises_loaded_from_yaml(module):
+    """Test YAML exercises get tuple positions in read-only params."""
+    exercise = module.get_lesson(0).get_exercise(1)
+    
+    assert exercise.expected_commands == ("^",)
+    assert exercise.validation_params["expected_position"] == (0, 4)
+    with pytest.raises(TypeError):
+        exercise.validation_params["expected_position"] = (0, 0)
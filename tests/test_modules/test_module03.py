@@ -0,0 +1,40 @@
+"""Tests for Module 3 lesson construction."""
+
+import pytest
+
+from vimgym.modules.base import load_lesson_specs
+from vimgym.modules.module03_text_editing import Module03TextEditing
+
+
+@pytest.fixture
+def module():
+    """Create an initialized Module 3 instance."""
+    module = Module03TextEditing()
+    module.initialize_content()
+    return module
+
+
+def test_exercise_lookup_builds_only_needed_lessons(module):
+    """Test exercise lookup by ID stops at the lesson that defines it."""
+    exercise = module.get_exercise_by_id("module_03_lesson_02_exercise_01")
+    
+    assert exercise is module.get_lesson(1).content.exercises[0]
+    assert list(module._lesson_cache) == ["module_03_lesson_01", "module_03_lesson_02"]
+    assert module.get_exercise_by_id("missing") is None
+
+
+def test_lesson_specs_are_read_only():
+    """Test the cached lesson specs cannot be mutated by callers."""
+    specs = load_lesson_specs("module03")
+    
+    with pytest.raises(TypeError):
+        specs["module_03_lesson_01"] = {}
+    with pytest.raises(TypeError):
+        specs["module_03_lesson_01"]["title"] = "Changed"
+    
+    exercise = specs["module_03_lesson_01"]["exercises"][0]
+    assert isinstance(specs["module_03_lesson_01"]["exercises"], tuple)
+    with pytest.raises(TypeError):
+        exercise["title"] = "Changed"
+    with pytest.raises(AttributeError):
+        exercise["expected_commands"].append("x")
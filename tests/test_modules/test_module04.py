@@ -0,0 +1,31 @@
+"""Tests for Module 4 lesson construction."""
+
+import pytest
+
+from vimgym.modules.module04_search_replace import Module04SearchReplace
+
+
+@pytest.fixture
+def module():
+    """Create an initialized Module 4 instance."""
+    module = Module04SearchReplace()
+    module.initialize_content()
+    return module
+
+
+def test_lesson_prose_loaded_from_markdown(module):
+    """Test lesson prose comes from the module's markdown files."""
+    content = module.get_lesson(0).content
+    
+    assert content.introduction.startswith("# Basic Search Operations")
+    assert content.summary.rstrip().endswith("Search is your fastest navigation tool in Vim!")
+
+
+def test_yaml_specs_build_typed_exercises(module):
+    """Test YAML lesson data yields tuple positions and typed expected text."""
+    search, replace = module.get_lesson(0), module.get_lesson(2)
+    
+    assert replace.content.title == "Basic Find and Replace"
+    assert search.content.exercises[0].validation_params["expected_position"] == (0, 7)
+    assert replace.content.exercises[0].expected_text == "This new text has old values"
+    assert replace.content.exercises[0].validation_params == {}
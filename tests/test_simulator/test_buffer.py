@@ -0,0 +1,215 @@
+"""Tests for the Vim text buffer."""
+
+import pytest
+
+from vimgym.simulator.buffer import VimBuffer
+
+
+@pytest.fixture
+def buffer():
+    """Create a buffer with a few lines of content."""
+    return VimBuffer("first line\nsecond line\nthird line")
+
+
+def test_undo_redo_single_line_edit(buffer):
+    """Test undo and redo of an edit within one line."""
+    buffer.move_to_position(1, 6)
+    buffer.insert_text("!")
+    assert buffer.get_line(1) == "second! line"
+    
+    assert buffer.undo()
+    assert buffer.get_content() == "first line\nsecond line\nthird line"
+    assert buffer.cursor_pos == (1, 6)
+    
+    assert buffer.redo()
+    assert buffer.get_line(1) == "second! line"
+    assert buffer.cursor_pos == (1, 7)
+    assert not buffer.redo()
+
+
+def test_undo_restores_line_count_changes(buffer):
+    """Test undo of edits that add, join and delete lines."""
+    original = buffer.get_content()
+    
+    buffer.move_to_position(0, 5)
+    buffer.insert_text("\nnew\n")
+    buffer.delete_line(2)
+    buffer.move_to_position(0, 5)
+    buffer.delete_char_at_cursor()
+    buffer.insert_line_above("top")
+    assert buffer.get_line_count() == 4
+    
+    for _ in range(4):
+        assert buffer.undo()
+    
+    assert buffer.get_content() == original
+    assert not buffer.undo()
+
+
+def test_undo_history_stores_only_changed_lines(buffer):
+    """Test a single-line edit records just that line for undo."""
+    buffer.delete_char_at_cursor()
+    
+    assert buffer.undo_stack[-1].lines == ["first line"]
+
+
+def test_set_content_is_undoable(buffer):
+    """Test replacing the whole buffer can be undone."""
+    buffer.set_content("replaced")
+    
+    assert buffer.undo()
+    assert buffer.lines == ["first line", "second line", "third line"]
+    assert buffer.redo()
+    assert buffer.get_content() == "replaced"
+
+
+def test_saved_state_independent_of_buffer(buffer):
+    """Test editing the buffer does not change a saved state."""
+    buffer.save_state("Checkpoint")
+    saved = buffer.undo_stack[-1]
+    
+    buffer.lines[0] = "changed"
+    buffer.lines.append("extra")
+    
+    assert saved.lines == ["first line", "second line", "third line"]
+
+
+def test_undo_history_is_capped(buffer):
+    """Test the oldest undo entries are dropped past the undo limit."""
+    for _ in range(buffer.max_undo_levels + 10):
+        buffer.insert_text("x")
+        buffer.break_undo_group()
+    
+    assert len(buffer.undo_stack) == buffer.max_undo_levels
+    assert buffer.undo_stack[0].description == "Insert text: 'x'"
+
+
+def test_content_cache_follows_edits(buffer):
+    """Test cached content is reused until the buffer changes."""
+    content = buffer.get_content()
+    assert buffer.get_content() is content
+    
+    buffer.replace_line(2, "last line")
+    assert buffer.get_content() == "first line\nsecond line\nlast line"
+    
+    buffer.undo()
+    assert buffer.get_content() == content
+
+
+@pytest.mark.parametrize("start, end, expected", [
+    ((0, 6), (0, 9), "line"),
+    ((0, 9), (0, 6), "line"),
+    ((0, 6), (2, 4), "line\nsecond line\nthird"),
+    ((2, 4), (1, 0), "second line\nthird"),
+])
+def test_visual_selection_text(buffer, start, end, expected):
+    """Test selected text for single and multi-line selections."""
+    buffer.visual_start, buffer.visual_end = start, end
+    
+    assert buffer.get_visual_selection() == expected
+    assert buffer.lines == ["first line", "second line", "third line"]
+
+
+def test_typing_run_undone_as_one_change(buffer):
+    """Test consecutive typing and backspaces form a single undo entry."""
+    for key in "abc":
+        buffer.insert_text(key)
+    buffer.delete_char_before_cursor()
+    assert buffer.get_line(0) == "abfirst line"
+    
+    assert buffer.undo()
+    assert buffer.get_line(0) == "first line"
+    assert buffer.cursor_pos == (0, 0)
+    assert not buffer.undo()
+
+
+def test_undo_group_ends_on_cursor_move_or_break(buffer):
+    """Test moving the cursor or breaking the group starts a new undo entry."""
+    buffer.insert_text("a")
+    buffer.move_cursor("right")
+    buffer.insert_text("b")
+    buffer.break_undo_group()
+    buffer.insert_text("c")
+    
+    assert buffer.undo()
+    assert buffer.get_line(0) == "afbirst line"
+    assert buffer.undo()
+    assert buffer.get_line(0) == "afirst line"
+
+
+@pytest.mark.parametrize("direction, count, expected, moved", [
+    ("down", 5, (3, 2), True),
+    ("up", 1, (0, 9), False),
+    ("left", 20, (0, 0), True),
+    ("right", 20, (0, 10), True),
+])
+def test_move_cursor_with_count(direction, count, expected, moved):
+    """Test counted moves stop at buffer edges and clamp to lines passed."""
+    buffer = VimBuffer("first line\nsecond line\nab\nlast line")
+    buffer.move_to_position(0, 9)
+    
+    assert buffer.move_cursor(direction, count) is moved
+    assert buffer.cursor_pos == expected
+
+
+def test_insert_multiline_text(buffer):
+    """Test inserting text with newlines splits the line around it."""
+    buffer.move_to_position(1, 6)
+    buffer.insert_text(" one\ntwo\nthree ")
+    
+    assert buffer.lines[1:4] == ["second one", "two", "three  line"]
+    assert buffer.cursor_pos == (3, 6)
+    assert buffer.get_line_count() == 5
+
+
+def test_restore_state_from_serialized_lists(buffer):
+    """Test restoring a state whose positions were saved as lists."""
+    state = buffer.get_state()
+    state.update(cursor_pos=[2, 40], visual_start=[0, 1], visual_end=None)
+    
+    other = VimBuffer()
+    other.restore_state(state)
+    
+    assert other.get_content() == buffer.get_content()
+    assert other.cursor_pos == (2, 10)
+    assert other.visual_start == (0, 1)
+    assert other.visual_end is None
+
+
+def test_no_op_mutations_skip_undo_history(buffer):
+    """Test edits that leave the buffer unchanged record no undo state."""
+    depth = len(buffer.undo_stack)
+    buffer.set_content(buffer.get_content())
+    assert not buffer.replace_line(0, "first line")
+    
+    empty = VimBuffer()
+    empty_depth = len(empty.undo_stack)
+    assert not empty.delete_line(0)
+    
+    assert len(buffer.undo_stack) == depth
+    assert len(empty.undo_stack) == empty_depth
+    assert not buffer.modified and not empty.modified
+
+
+def test_get_line_out_of_range_is_empty(buffer):
+    """Test lines past either end of the buffer read as empty strings."""
+    assert buffer.get_line(-1) == ''
+    assert buffer.get_line(3) == ''
+
+
+def test_undo_after_restore_state():
+    """Test undo history recorded before a restore is not replayed on it."""
+    buffer = VimBuffer("one\ntwo\nthree")
+    state = buffer.get_state()
+    buffer.delete_line(0)
+    buffer.delete_line(0)
+    
+    buffer.restore_state(state)
+    
+    assert not buffer.undo()
+    assert not buffer.redo()
+    assert buffer.lines == ["one", "two", "three"]
+    
+    buffer.delete_line(1)
+    assert buffer.undo()
+    assert buffer.lines == ["one", "two", "three"]
@@ -0,0 +1,147 @@
+"""Tests for Vim command processing."""
+
+import pytest
+
+from vimgym.simulator.buffer import VimBuffer
+from vimgym.simulator.commands import VimCommandProcessor
+from vimgym.simulator.modes import ModeManager
+from vimgym.simulator.simulator import VimSimulator
+
+
+@pytest.fixture
+def processor():
+    """Command processor over a small three-line buffer."""
+    buffer = VimBuffer("first line\nsecond line\nthird line")
+    return VimCommandProcessor(buffer, ModeManager())
+
+
+def test_multi_key_command_prefixes(processor):
+    """Test partial commands wait for more keys and complete on the last one."""
+    processor.buffer.move_to_position(2, 3)
+    
+    result = processor.process_key('g')
+    assert result.success
+    assert processor.command_buffer == 'g'
+    
+    result = processor.process_key('g')
+    assert result.success
+    assert processor.buffer.cursor_pos == (0, 0)
+    assert processor.command_buffer == ""
+
+
+def test_unknown_command_resets_buffer(processor):
+    """Test a key that cannot extend the pending command is rejected."""
+    processor.process_key('g')
+    result = processor.process_key('z')
+    
+    assert not result.success
+    assert processor.command_buffer == ""
+
+
+@pytest.mark.parametrize("command,success", [
+    ("s/old/new/", True),
+    ("s/old/new/g", True),
+    ("s/old/new", False),
+])
+def test_substitute_syntax(processor, command, success):
+    """Test the Ex substitute command parses s/old/new/ with an optional flag."""
+    result = processor._execute_ex_command(command)
+    
+    assert result.success is success
+    if success:
+        assert "'old' with 'new'" in result.message
+
+
+def test_digit_after_pending_command_is_not_a_count(processor):
+    """Test digits only start a count when no command is pending."""
+    processor.process_key('g')
+    result = processor.process_key('2')
+    
+    assert not result.success
+    assert processor.repeat_count == 1
+
+
+def test_multi_digit_input_is_a_count(processor):
+    """Test a whole number typed as one input, as practice mode sends it, is a count."""
+    result = processor.process_key('10')
+    
+    assert result.success
+    assert result.message.startswith("Count:")
+    assert processor.repeat_count > 1
+
+
+def test_non_ascii_digit_is_not_a_count(processor):
+    """Test only ASCII digits start a count."""
+    result = processor.process_key('²')
+    
+    assert not result.success
+    assert processor.repeat_count == 1
+
+
+def test_keys_dispatched_by_mode(processor):
+    """Test each mode handles keys with its own processing."""
+    processor.process_key('i')
+    processor.process_key('x')
+    assert processor.buffer.get_line(0) == "xfirst line"
+    
+    processor.process_key('\x1b')
+    processor.process_key('V')
+    result = processor.process_key('j')
+    assert result.success and result.cursor_moved
+    
+    processor.process_key('\x1b')
+    processor.process_key('R')
+    result = processor.process_key('x')
+    assert not result.success
+    assert "not implemented" in result.error
+
+
+@pytest.mark.parametrize("keys,expected", [
+    ("w", (0, 6)),
+    ("ww", (1, 0)),
+    ("e", (0, 4)),
+    ("we", (0, 9)),
+    ("$b", (0, 6)),
+    ("$bb", (0, 0)),
+])
+def test_word_motions(processor, keys, expected):
+    """Test w, b and e move between alphanumeric words."""
+    for key in keys:
+        processor.process_key(key)
+    
+    assert processor.buffer.cursor_pos == expected
+
+
+@pytest.mark.parametrize("content,keys,expected", [
+    (" \t indented", "^", (0, 3)),
+    ("   ", "^", (0, 3)),
+    ("trailing \t ", "g_", (0, 7)),
+    ("   ", "g_", (0, 0)),
+])
+def test_nonblank_motions(processor, content, keys, expected):
+    """Test ^ and g_ skip leading and trailing whitespace."""
+    processor.buffer.set_content(content)
+    processor.buffer.move_to_position(0, 1)
+    
+    for key in keys:
+        processor.process_key(key)
+    assert processor.buffer.cursor_pos == expected
+
+
+def test_command_maps_bound_per_processor(processor):
+    """Test each processor binds the shared command tables to itself."""
+    other = VimCommandProcessor(VimBuffer(), ModeManager())
+    
+    method, args = processor.normal_commands['w']
+    assert method.__self__ is processor
+    assert args == ('forward',)
+    assert other.normal_commands['w'][0].__self__ is other
+    assert set(other.movement_commands) <= set(other.normal_commands)
+
+
+def test_learning_mode_toggles_command_validation():
+    """Test the simulator can switch command validation on the processor."""
+    simulator = VimSimulator()
+    
+    simulator.set_learning_mode(False)
+    assert simulator.command_processor.validate_commands is False
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from datetime import datetime
 import time
 
-from ..modules.base import Exercise, ExerciseResult, LessonSession
+from ..modules.base import Exercise, ExerciseResult, LessonSession, ValidationType
 from ..simulator.simulator import VimSimulator, SimulatorResponse
 from ..core.progress import ProgressManager
 
@@ -23,6 +23,7 @@ class ExerciseState:
     mistakes_made: int
     current_hint_index: int
     is_completed: bool
+    on_expected_path: bool = True  # executed commands are a prefix of expected
     
     @property
     def elapsed_time(self) -> int:
@@ -37,27 +38,23 @@ class ExerciseEngine:
         self.simulator = simulator
         self.progress_manager = progress_manager
         self.current_exercise: Optional[ExerciseState] = None
-        self.validation_functions: Dict[str, Callable] = {}
+        self.validation_functions: Dict[ValidationType, Callable] = {}
         self._setup_validators()
     
     def _setup_validators(self) -> None:
         """Setup built-in validation functions."""
         self.validation_functions = {
-            "commands": self._validate_commands,
-            "cursor_position": self._validate_cursor_position,
-            "text_content": self._validate_text_content,
-            "mode_state": self._validate_mode_state,
-            "custom": self._validate_custom
+            ValidationType.COMMANDS: self._validate_commands,
+            ValidationType.CURSOR_POSITION: self._validate_cursor_position,
+            ValidationType.TEXT_CONTENT: self._validate_text_content,
+            ValidationType.MODE_STATE: self._validate_mode_state,
+            ValidationType.CUSTOM: self._validate_custom
         }
     
     def start_exercise(self, exercise: Exercise, session: LessonSession) -> ExerciseState:
         """Start a new exercise."""
-        # Reset simulator to initial state
-        self.simulator.reset()
-        
-        # Set up initial text if provided
-        if exercise.initial_text:
-            self.simulator.buffer.set_content(exercise.initial_text)
+        # Reset simulator to initial state with the exercise text loaded
+        self.simulator.reset(exercise.initial_text)
         
         # Create exercise state
         self.current_exercise = ExerciseState(
@@ -88,10 +85,15 @@ class ExerciseEngine:
         # Track command
         self.current_exercise.commands_executed.append(command)
         
-        # Check if command was expected (for real-time feedback)
-        expected_so_far = self.current_exercise.exercise.expected_commands[:len(self.current_exercise.commands_executed)]
-        if self.current_exercise.commands_executed != expected_so_far:
-            self.current_exercise.mistakes_made += 1
+        # Check if command was expected (for real-time feedback); only the
+        # newest command needs comparing while the prefix still matches
+        state = self.current_exercise
+        if state.on_expected_path:
+            state.on_expected_path = state.exercise.expects_command_at(
+                len(state.commands_executed) - 1, command
+            )
+        if not state.on_expected_path:
+            state.mistakes_made += 1
         
         # Check for completion
         completion_result = self._check_completion()
@@ -138,7 +140,9 @@ class ExerciseEngine:
         executed = state["commands_executed"]
         expected = exercise.expected_commands
         
-        if executed == expected:
+        # execute_command() tracks whether the executed commands are still a
+        # prefix of the expected ones, so no rescan of the history is needed
+        if exercise_state.on_expected_path and len(executed) == len(expected):
             return ExerciseResult(
                 passed=True,
                 score=100,
@@ -149,24 +153,17 @@ class ExerciseEngine:
             )
         
         # Check partial completion
-        if len(executed) <= len(expected):
-            correct_count = 0
-            for i, cmd in enumerate(executed):
-                if i < len(expected) and cmd == expected[i]:
-                    correct_count += 1
-                else:
-                    break
-            
-            if correct_count == len(executed):
-                # Still on track, not completed yet
-                return ExerciseResult(
-                    passed=False,
-                    score=int((correct_count / len(expected)) * 100),
-                    feedback=f"Good progress: {correct_count}/{len(expected)} commands correct",
-                    time_taken=exercise_state.elapsed_time,
-                    hints_used=exercise_state.hints_used,
-                    mistakes_made=exercise_state.mistakes_made
-                )
+        if exercise_state.on_expected_path:
+            # Still on track, not completed yet
+            correct_count = len(executed)
+            return ExerciseResult(
+                passed=False,
+                score=int((correct_count / len(expected)) * 100),
+                feedback=f"Good progress: {correct_count}/{len(expected)} commands correct",
+                time_taken=exercise_state.elapsed_time,
+                hints_used=exercise_state.hints_used,
+                mistakes_made=exercise_state.mistakes_made
+            )
         
         # Commands don't match expected sequence
         return ExerciseResult(
@@ -217,11 +214,10 @@ class ExerciseEngine:
     def _validate_text_content(self, exercise: Exercise, state: Dict[str, Any],
                               exercise_state: ExerciseState) -> ExerciseResult:
         """Validate based on text content."""
-        expected_text = exercise.validation_params.get("expected_text", "")
         actual_text = state["buffer_content"]
         
-        # Normalize whitespace for comparison
-        expected_normalized = expected_text.strip()
+        # Normalize whitespace for comparison; the expected side is pre-trimmed
+        expected_normalized = exercise.normalized_expected_text
         actual_normalized = actual_text.strip()
         
         if actual_normalized == expected_normalized:
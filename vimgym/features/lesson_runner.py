@@ -385,7 +385,7 @@ class LessonNavigator:
             return f"{module.title} → Unknown Lesson"
         
         lesson_index = next(
-            (i for i, l in enumerate(module.lessons) if l.id == lesson_id),
+            (i for i, l_id in enumerate(module.list_lesson_ids()) if l_id == lesson_id),
             None
         )
         
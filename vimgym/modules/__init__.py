@@ -2,7 +2,7 @@
 
 from .base import (
     LearningModule, Lesson, LessonContent, Exercise, ExerciseResult,
-    LessonSession, ModuleManager
+    LessonSession, ModuleManager, ValidationType
 )
 from .content_manager import ContentManager, ContentValidator
 from .module01_basics import Module01Basics
@@ -16,6 +16,7 @@ __all__ = [
     "LessonContent",
     "Exercise",
     "ExerciseResult",
+    "ValidationType",
     "LessonSession",
     "ModuleManager",
     "ContentManager",
@@ -4,44 +4,224 @@ Base classes for VimGym learning modules and lessons.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Callable
+from enum import Enum
+from typing import List, Optional, Dict, Any, Callable, Mapping, Tuple
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+import functools
+import sys
+import textwrap
 import uuid
 
+import yaml
+
 from ..core.progress import ModuleProgress, LessonProgress
 from ..simulator.simulator import VimSimulator, SimulatorResponse
+from ..utils.compat import DATACLASS_SLOTS
 
 
-@dataclass
+# Canonical hint tuples, so exercises with identical hints share one object
+_HINT_TUPLES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+# Read-only validation params, shared between exercises with equal params
+_VALIDATION_PARAMS: Dict[Tuple[Tuple[str, Any], ...], Mapping[str, Any]] = {}
+
+# Use libyaml's parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Lesson fields that may live in markdown files instead of the YAML spec
+_PROSE_FIELDS = ("introduction", "instructions", "summary")
+
+LESSON_DATA_DIR = Path(__file__).parent.parent / "data" / "lessons"
+
+
+@functools.lru_cache(maxsize=None)
+def load_lesson_text(module_dir: str, name: str) -> str:
+    """Load lesson prose from a markdown file under the lesson data directory."""
+    return (LESSON_DATA_DIR / module_dir / f"{name}.md").read_text(encoding="utf-8")
+
+
+def _deep_freeze(value: Any) -> Any:
+    """Return parsed YAML data with dicts as read-only mappings and lists as tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _deep_freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_deep_freeze(item) for item in value)
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def load_lesson_specs(module_dir: str) -> Mapping[str, Mapping[str, Any]]:
+    """Load a module's lesson specs from ``<module_dir>.yaml``, keyed by ID in order.
+    
+    The result is cached and shared, so it is frozen all the way down:
+    mappings are read-only and lists become tuples.
+    """
+    with open(LESSON_DATA_DIR / f"{module_dir}.yaml", "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    return MappingProxyType(
+        {spec["id"]: _deep_freeze(spec) for spec in data["lessons"]}
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def load_lesson(module_dir: str, lesson_id: str) -> 'Lesson':
+    """Build a lesson from its YAML spec, once per process.
+    
+    Prose fields missing from the spec are read from
+    ``<module_dir>/<lesson_id>_<field>.md``.
+    """
+    spec = dict(load_lesson_specs(module_dir)[lesson_id])
+    for name in _PROSE_FIELDS:
+        if name not in spec:
+            spec[name] = load_lesson_text(module_dir, f"{lesson_id}_{name}")
+    return Lesson.from_dict(spec)
+
+
+def clear_lesson_cache() -> None:
+    """Forget cached lesson data so it is re-read from disk on next access.
+    
+    The pools of shared hints and validation params are emptied too. Modules that already built a lesson keep their own reference to it;
+    create a new module instance to pick up edited content.
+    """
+    load_lesson.cache_clear()
+    load_lesson_specs.cache_clear()
+    load_lesson_text.cache_clear()
+    _HINT_TUPLES.clear()
+    _VALIDATION_PARAMS.clear()
+
+
+def _clean_prose(text: str) -> str:
+    """Dedent and trim a prose block."""
+    return textwrap.dedent(text).strip()
+
+
+def _freeze_validation_params(params: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Return params as a read-only mapping, shared between equal params.
+    
+    YAML has no tuples, so an ``expected_position`` list is converted back.
+    """
+    frozen = dict(params)
+    if "expected_position" in frozen:
+        frozen["expected_position"] = tuple(frozen["expected_position"])
+    key = tuple(sorted(frozen.items()))
+    try:
+        return _VALIDATION_PARAMS.setdefault(key, MappingProxyType(frozen))
+    except TypeError:  # unhashable values cannot be shared
+        return MappingProxyType(frozen)
+
+
+class ValidationType(str, Enum):
+    """How an exercise decides it has been completed.
+    
+    Members compare equal to their string values, so lesson data can keep
+    using plain strings.
+    """
+    COMMANDS = "commands"
+    CURSOR_POSITION = "cursor_position"
+    TEXT_CONTENT = "text_content"
+    MODE_STATE = "mode_state"
+    CUSTOM = "custom"
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Exercise:
-    """Individual exercise within a lesson."""
+    """Individual exercise within a lesson.
+    
+    Exercises are immutable and hashable. Fields are in positional order so
+    content tables can build exercises with ``Exercise(*row)``.
+    """
     
     id: str
     title: str
     description: str
     instructions: str
-    expected_commands: List[str]
+    expected_commands: Tuple[str, ...]
     initial_text: str = ""
-    validation_type: str = "commands"  # commands, cursor_position, text_content
-    validation_params: Dict[str, Any] = field(default_factory=dict)
-    hints: List[str] = field(default_factory=list)
+    validation_type: ValidationType = ValidationType.COMMANDS
+    validation_params: Mapping[str, Any] = field(default_factory=dict, hash=False)
+    hints: Tuple[str, ...] = ()
     time_limit: Optional[int] = None  # seconds
+    expected_text: str = ""  # final buffer text for text_content validation
+    # Whitespace-trimmed expected text, computed once for text validation
+    normalized_expected_text: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Normalize fields: tuples, a ValidationType, and shared read-only params."""
+        params = self.validation_params
+        expected_text = self.expected_text
+        if "expected_text" in params:
+            # Older content passes the expected text as a validation param
+            params = dict(params)
+            legacy_text = params.pop("expected_text")
+            expected_text = expected_text or legacy_text
+        # Hints repeat across lessons too, so each string is interned as well
+        # as the tuple being pooled
+        hints = tuple(sys.intern(str(hint)) for hint in self.hints)
+        try:
+            validation_type = ValidationType(self.validation_type)
+        except ValueError:
+            # Unknown types from bad lesson data fail validation, not loading
+            validation_type = self.validation_type
+        
+        # Frozen dataclass: normalized values are set through object.__setattr__
+        set_field = functools.partial(object.__setattr__, self)
+        # Command tokens repeat across exercises; intern them so YAML-loaded
+        # lessons share one string per token
+        commands = tuple(sys.intern(str(command)) for command in self.expected_commands)
+        set_field("expected_commands", commands)
+        set_field("validation_type", validation_type)
+        set_field("validation_params", _freeze_validation_params(params))
+        set_field("hints", _HINT_TUPLES.setdefault(hints, hints))
+        set_field("expected_text", expected_text)
+        set_field("normalized_expected_text", expected_text.strip())
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Exercise':
+        """Create an exercise from its dictionary representation."""
+        return cls(
+            id=data["id"],
+            title=data["title"],
+            description=data["description"],
+            instructions=data["instructions"],
+            expected_commands=data["expected_commands"],
+            initial_text=data.get("initial_text", ""),
+            validation_type=data.get("validation_type", ValidationType.COMMANDS),
+            validation_params=data.get("validation_params", {}),
+            hints=data.get("hints", ()),
+            time_limit=data.get("time_limit"),
+            expected_text=data.get("expected_text", "")
+        )
+    
+    @property
+    def validation_type_name(self) -> str:
+        """The validation type as a plain string, for serializing.
+        
+        Unknown types from lesson data are kept as strings rather than
+        ValidationType members, so both are handled here.
+        """
+        return getattr(self.validation_type, "value", self.validation_type)
+    
+    def expects_command_at(self, index: int, command: str) -> bool:
+        """Check whether ``command`` is the expected command at ``index``."""
+        return index < len(self.expected_commands) and self.expected_commands[index] == command
     
     def validate_completion(self, executed_commands: List[str], 
                           final_state: Dict[str, Any]) -> 'ExerciseResult':
         """Validate if exercise was completed correctly."""
-        if self.validation_type == "commands":
+        if self.validation_type is ValidationType.COMMANDS:
             return self._validate_commands(executed_commands)
-        elif self.validation_type == "cursor_position":
+        elif self.validation_type is ValidationType.CURSOR_POSITION:
             return self._validate_cursor_position(final_state)
-        elif self.validation_type == "text_content":
+        elif self.validation_type is ValidationType.TEXT_CONTENT:
             return self._validate_text_content(final_state)
         else:
             return ExerciseResult(False, 0, "Unknown validation type")
     
     def _validate_commands(self, executed_commands: List[str]) -> 'ExerciseResult':
         """Validate based on expected command sequence."""
-        if executed_commands == self.expected_commands:
+        if tuple(executed_commands) == self.expected_commands:
             return ExerciseResult(True, 100, "Perfect! Commands executed correctly.")
         
         # Partial credit for correct commands
@@ -70,10 +250,9 @@ class Exercise:
     
     def _validate_text_content(self, final_state: Dict[str, Any]) -> 'ExerciseResult':
         """Validate based on final text content."""
-        expected_text = self.validation_params.get("expected_text", "")
         actual_text = final_state.get("buffer_content", "")
         
-        if actual_text.strip() == expected_text.strip():
+        if actual_text.strip() == self.normalized_expected_text:
             return ExerciseResult(True, 100, "Text content is correct!")
         else:
             return ExerciseResult(False, 0, 
@@ -91,27 +270,60 @@ class ExerciseResult:
     mistakes_made: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class LessonContent:
-    """Content structure for a lesson."""
+    """Content structure for a lesson. Immutable, like its exercises."""
     title: str
     description: str
-    learning_objectives: List[str]
+    learning_objectives: Tuple[str, ...]
     introduction: str
     instructions: str
-    exercises: List[Exercise]
+    exercises: Tuple[Exercise, ...]
     summary: str = ""
-    tips: List[str] = field(default_factory=list)
-    common_mistakes: List[str] = field(default_factory=list)
+    tips: Tuple[str, ...] = ()
+    common_mistakes: Tuple[str, ...] = ()
+    
+    def __post_init__(self) -> None:
+        """Store read-only sequences as tuples."""
+        for name in ("exercises", "learning_objectives", "tips", "common_mistakes"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
 
 
 class Lesson:
-    """Individual lesson within a module."""
+    """Individual lesson within a module.
+    
+    Lessons are static content: modules may cache and share a single Lesson
+    between instances, so a lesson and its content must not be mutated after
+    construction.
+    """
+    
+    __slots__ = ("id", "content", "created_at")
     
     def __init__(self, lesson_id: str, content: LessonContent):
         self.id = lesson_id
         self.content = content
         self.created_at = datetime.now()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Lesson':
+        """Create a lesson from its dictionary representation.
+        
+        The layout matches the YAML lesson format used by the content manager.
+        Prose fields are dedented and trimmed here, once, so renderers can
+        print them as-is.
+        """
+        content = LessonContent(
+            title=data["title"],
+            description=data["description"],
+            learning_objectives=data["learning_objectives"],
+            introduction=_clean_prose(data["introduction"]),
+            instructions=_clean_prose(data["instructions"]),
+            exercises=tuple(Exercise.from_dict(ex) for ex in data["exercises"]),
+            summary=_clean_prose(data.get("summary", "")),
+            tips=data.get("tips", ()),
+            common_mistakes=data.get("common_mistakes", ())
+        )
+        return cls(data["id"], content)
         
     @property
     def title(self) -> str:
@@ -237,27 +449,76 @@ class LearningModule(ABC):
         self.id = module_id
         self.title = title
         self.description = description
-        self.lessons: List[Lesson] = []
         self.prerequisites: List[str] = []
         self.estimated_duration = 60  # minutes
         
+        # Lessons in order; pending ones are built on first access
+        self._lesson_ids: List[str] = []
+        self._lesson_cache: Dict[str, Lesson] = {}
+        self._lesson_factories: Dict[str, Callable[[], Lesson]] = {}
+        # Exercises of built lessons, filled in as lessons are built
+        self._exercise_index: Dict[str, Exercise] = {}
+    
+    @property
+    def lessons(self) -> List[Lesson]:
+        """All lessons in order, building any that are still pending."""
+        return [self._materialize_lesson(lesson_id) for lesson_id in self._lesson_ids]
+        
     def add_lesson(self, lesson: Lesson) -> None:
         """Add lesson to module."""
-        self.lessons.append(lesson)
+        self._lesson_ids.append(lesson.id)
+        self._cache_lesson(lesson)
+    
+    def add_lesson_factories(self, factories: Mapping[str, Callable[[], Lesson]]) -> None:
+        """Register several lazily built lessons, keyed by lesson ID in order."""
+        self._lesson_ids.extend(factories)
+        self._lesson_factories.update(factories)
+    
+    def list_lesson_ids(self) -> List[str]:
+        """Get lesson IDs in order without building any lessons."""
+        return list(self._lesson_ids)
+    
+    def _materialize_lesson(self, lesson_id: str) -> Lesson:
+        """Return a lesson, building it from its factory if still pending."""
+        lesson = self._lesson_cache.get(lesson_id)
+        if lesson is None:
+            # Drop the factory only once it succeeds, so a failed build can
+            # be retried and keeps raising its own error
+            lesson = self._lesson_factories[lesson_id]()
+            self._cache_lesson(lesson)
+            del self._lesson_factories[lesson_id]
+        return lesson
+    
+    def _cache_lesson(self, lesson: Lesson) -> None:
+        """Store a built lesson and index its exercises by ID."""
+        self._lesson_cache[lesson.id] = lesson
+        for exercise in lesson.content.exercises:
+            self._exercise_index[exercise.id] = exercise
     
     def get_lesson(self, lesson_index: int) -> Optional[Lesson]:
         """Get lesson by index."""
-        if 0 <= lesson_index < len(self.lessons):
-            return self.lessons[lesson_index]
+        if 0 <= lesson_index < len(self._lesson_ids):
+            return self._materialize_lesson(self._lesson_ids[lesson_index])
         return None
     
     def get_lesson_by_id(self, lesson_id: str) -> Optional[Lesson]:
         """Get lesson by ID."""
-        for lesson in self.lessons:
-            if lesson.id == lesson_id:
-                return lesson
+        if lesson_id in self._lesson_cache or lesson_id in self._lesson_factories:
+            return self._materialize_lesson(lesson_id)
         return None
     
+    def get_exercise_by_id(self, exercise_id: str) -> Optional[Exercise]:
+        """Get exercise by ID, building pending lessons only until it is found."""
+        exercise = self._exercise_index.get(exercise_id)
+        if exercise is None:
+            for lesson_id in self._lesson_ids:
+                if lesson_id in self._lesson_factories:
+                    self._materialize_lesson(lesson_id)
+                    exercise = self._exercise_index.get(exercise_id)
+                    if exercise is not None:
+                        break
+        return exercise
+    
     def is_unlocked(self, user_progress: ModuleProgress) -> bool:
         """Check if module is unlocked for user."""
         # Check prerequisites
@@ -271,18 +532,18 @@ class LearningModule(ABC):
         """Get next incomplete lesson for user."""
         module_progress = user_progress.get_module_progress(self.id)
         if not module_progress:
-            return self.lessons[0] if self.lessons else None
+            return self.get_lesson(0)
         
         completed_lessons = set(module_progress.lessons_completed)
-        for lesson in self.lessons:
-            if lesson.id not in completed_lessons:
-                return lesson
+        for lesson_id in self._lesson_ids:
+            if lesson_id not in completed_lessons:
+                return self._materialize_lesson(lesson_id)
         
         return None  # All lessons completed
     
     def calculate_completion(self, user_progress: ModuleProgress) -> float:
         """Calculate module completion percentage."""
-        if not self.lessons:
+        if not self._lesson_ids:
             return 1.0
         
         module_progress = user_progress.get_module_progress(self.id)
@@ -290,11 +551,11 @@ class LearningModule(ABC):
             return 0.0
         
         completed_count = len(module_progress.lessons_completed)
-        return completed_count / len(self.lessons)
+        return completed_count / len(self._lesson_ids)
     
     @property
     def lesson_count(self) -> int:
-        return len(self.lessons)
+        return len(self._lesson_ids)
     
     @abstractmethod
     def initialize_content(self) -> None:
@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import asdict
 
-from .base import LearningModule, Lesson, LessonContent, Exercise, ModuleManager
+from .base import LearningModule, Lesson, ModuleManager
 from .module01_basics import Module01Basics
 from .module02_movement import Module02Movement
 from .module03_text_editing import Module03TextEditing
@@ -50,23 +50,24 @@ class ContentManager:
             "id": lesson.id,
             "title": lesson.content.title,
             "description": lesson.content.description,
-            "learning_objectives": lesson.content.learning_objectives,
+            "learning_objectives": list(lesson.content.learning_objectives),
             "introduction": lesson.content.introduction,
             "instructions": lesson.content.instructions,
             "summary": lesson.content.summary,
-            "tips": lesson.content.tips,
-            "common_mistakes": lesson.content.common_mistakes,
+            "tips": list(lesson.content.tips),
+            "common_mistakes": list(lesson.content.common_mistakes),
             "exercises": [
                 {
                     "id": ex.id,
                     "title": ex.title,
                     "description": ex.description,
                     "instructions": ex.instructions,
-                    "expected_commands": ex.expected_commands,
+                    "expected_commands": list(ex.expected_commands),
                     "initial_text": ex.initial_text,
-                    "validation_type": ex.validation_type,
-                    "validation_params": ex.validation_params,
-                    "hints": ex.hints,
+                    "validation_type": ex.validation_type_name,
+                    "validation_params": dict(ex.validation_params),
+                    "expected_text": ex.expected_text,
+                    "hints": list(ex.hints),
                     "time_limit": ex.time_limit
                 }
                 for ex in lesson.content.exercises
@@ -81,47 +82,20 @@ class ContentManager:
         with open(filepath, 'r', encoding='utf-8') as f:
             data = yaml.safe_load(f)
         
-        exercises = [
-            Exercise(
-                id=ex["id"],
-                title=ex["title"],
-                description=ex["description"],
-                instructions=ex["instructions"],
-                expected_commands=ex["expected_commands"],
-                initial_text=ex.get("initial_text", ""),
-                validation_type=ex.get("validation_type", "commands"),
-                validation_params=ex.get("validation_params", {}),
-                hints=ex.get("hints", []),
-                time_limit=ex.get("time_limit")
-            )
-            for ex in data["exercises"]
-        ]
-        
-        content = LessonContent(
-            title=data["title"],
-            description=data["description"],
-            learning_objectives=data["learning_objectives"],
-            introduction=data["introduction"],
-            instructions=data["instructions"],
-            exercises=exercises,
-            summary=data.get("summary", ""),
-            tips=data.get("tips", []),
-            common_mistakes=data.get("common_mistakes", [])
-        )
-        
-        return Lesson(data["id"], content)
+        return Lesson.from_dict(data)
     
     def export_module_to_json(self, module: LearningModule, filepath: Path) -> None:
         """Export a module structure to JSON format."""
+        first = module.get_lesson(0)
         module_data = {
             "id": module.id,
             "title": module.title,
             "description": module.description,
             "prerequisites": module.prerequisites,
             "estimated_duration": module.estimated_duration,
-            "lesson_ids": [lesson.id for lesson in module.lessons],
+            "lesson_ids": module.list_lesson_ids(),
             "metadata": {
-                "created_at": module.lessons[0].created_at.isoformat() if module.lessons else None,
+                "created_at": first.created_at.isoformat() if first else None,
                 "lesson_count": module.lesson_count
             }
         }
@@ -255,7 +229,7 @@ Next steps or what comes next.
             module_info = {
                 "id": module.id,
                 "title": module.title,
-                "lessons": len(module.lessons),
+                "lessons": module.lesson_count,
                 "estimated_duration": module.estimated_duration,
                 "prerequisites": len(module.prerequisites)
             }
@@ -314,7 +288,7 @@ Next steps or what comes next.
             return None
         
         lesson_index = next(
-            (i for i, l in enumerate(module.lessons) if l.id == lesson_id), 
+            (i for i, l_id in enumerate(module.list_lesson_ids()) if l_id == lesson_id), 
             None
         )
         
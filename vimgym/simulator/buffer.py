@@ -1,40 +1,72 @@
 """Text buffer simulation for VimGym."""
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Union
-import copy
+from typing import Deque, List, Optional, Sequence, Tuple, Union
 
+from ..utils.compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class BufferState:
-    """Represents a saved state of the buffer for undo/redo."""
+    """Represents a saved state of the buffer for undo/redo.
+    
+    With ``count`` left as None the state is a full snapshot of the buffer.
+    Otherwise it records a single change: ``lines`` are the lines that used
+    to start at line ``start``, since replaced by ``count`` other lines.
+    """
     lines: List[str]
     cursor_pos: Tuple[int, int]
     description: str = ""
+    start: int = 0
+    count: Optional[int] = None
     
     def __post_init__(self):
-        """Ensure lines are properly copied."""
-        self.lines = copy.deepcopy(self.lines)
+        """Ensure lines are properly copied.
+        
+        Lines are immutable strings, so a shallow copy is enough.
+        """
+        self.lines = list(self.lines)
+
+
+def _as_position(value: Optional[Sequence[int]]) -> Optional[Tuple[int, int]]:
+    """Return a saved (line, column) position as a tuple, or None if unset.
+    
+    Positions saved as tuples are reused; JSON round trips turn them into lists.
+    """
+    if not value:
+        return None
+    return value if type(value) is tuple else (value[0], value[1])
 
 
 class VimBuffer:
     """Simulates a Vim text buffer with undo/redo functionality."""
     
+    __slots__ = (
+        "lines", "_content_cache", "cursor_pos", "visual_start", "visual_end",
+        "max_undo_levels", "undo_stack", "redo_stack", "_undo_group_pos",
+        "modified", "filename",
+    )
+    
     def __init__(self, content: str = ""):
         """Initialize buffer with optional content.
         
         Args:
             content: Initial text content
         """
-        self.lines = content.split('\n') if content else ['']
+        # Unlike splitlines(), split keeps a trailing empty line and gives [''] for ''
+        self.lines = content.split('\n')
+        self._content_cache: Optional[str] = None  # joined lines, see get_content
         self.cursor_pos = (0, 0)  # (line, column)
         self.visual_start: Optional[Tuple[int, int]] = None
         self.visual_end: Optional[Tuple[int, int]] = None
         
-        # Undo/redo stacks
-        self.undo_stack: List[BufferState] = []
-        self.redo_stack: List[BufferState] = []
+        # Undo/redo stacks; the oldest undo entry is dropped once the limit is hit
         self.max_undo_levels = 100
+        self.undo_stack: Deque[BufferState] = deque(maxlen=self.max_undo_levels)
+        self.redo_stack: Deque[BufferState] = deque()
+        # Cursor left by the last typed edit; typing from there extends its undo entry
+        self._undo_group_pos: Optional[Tuple[int, int]] = None
         
         # Save initial state
         self.save_state("Initial buffer state")
@@ -50,20 +82,82 @@ class VimBuffer:
             description: Description of the change being made
         """
         state = BufferState(
-            lines=self.lines.copy(),
+            lines=self.lines,
             cursor_pos=self.cursor_pos,
             description=description
         )
         
         self.undo_stack.append(state)
-        
-        # Limit undo stack size
-        if len(self.undo_stack) > self.max_undo_levels:
-            self.undo_stack = self.undo_stack[-self.max_undo_levels:]
+        self._undo_group_pos = None
         
         # Clear redo stack when new change is made
         self.redo_stack.clear()
     
+    def break_undo_group(self) -> None:
+        """End the current run of typing, so the next edit is undone separately."""
+        self._undo_group_pos = None
+    
+    def _save_change(
+        self, start: int, end: int, count: int, description: str, typing: bool = False
+    ) -> None:
+        """Record that lines ``start:end`` are about to be replaced by ``count`` lines.
+        
+        Only the affected lines are stored, so undo history grows with the
+        size of each edit rather than the size of the buffer.
+        
+        Args:
+            start: First line being replaced
+            end: Line after the last one being replaced
+            count: Number of lines that will replace them
+            description: Description of the change being made
+            typing: True for a one-line insert or backspace, which extends
+                the previous one if the cursor has not moved since
+        """
+        # Every edit is recorded here first, so cached content goes stale here
+        self._invalidate()
+        self.redo_stack.clear()
+        
+        if typing and self.undo_stack and self.cursor_pos == self._undo_group_pos:
+            # The top entry already holds this line as it was before the run
+            return
+        
+        self._undo_group_pos = None
+        self.undo_stack.append(BufferState(
+            lines=self.lines[start:end],
+            cursor_pos=self.cursor_pos,
+            description=description,
+            start=start,
+            count=count
+        ))
+    
+    def _apply_state(self, state: BufferState) -> BufferState:
+        """Put back the lines and cursor recorded in a state.
+        
+        Args:
+            state: Snapshot or change to apply
+            
+        Returns:
+            The state that reverses this one
+        """
+        start = state.start
+        end = len(self.lines) if state.count is None else start + state.count
+        inverse = BufferState(
+            lines=self.lines[start:end],
+            cursor_pos=self.cursor_pos,
+            description=state.description,
+            start=start,
+            count=len(state.lines)
+        )
+        self.lines[start:end] = state.lines
+        self.cursor_pos = state.cursor_pos
+        self._undo_group_pos = None
+        self._invalidate()
+        return inverse
+    
+    def _invalidate(self) -> None:
+        """Drop derived data cached from the current lines."""
+        self._content_cache = None
+    
     def undo(self) -> bool:
         """Undo the last change.
         
@@ -73,18 +167,9 @@ class VimBuffer:
         if len(self.undo_stack) <= 1:  # Keep at least initial state
             return False
         
-        # Save current state to redo stack
-        current_state = BufferState(
-            lines=self.lines.copy(),
-            cursor_pos=self.cursor_pos,
-            description="Current state"
-        )
-        self.redo_stack.append(current_state)
-        
-        # Restore previous state
+        # Revert the last change, keeping its inverse for redo
         previous_state = self.undo_stack.pop()
-        self.lines = previous_state.lines.copy()
-        self.cursor_pos = previous_state.cursor_pos
+        self.redo_stack.append(self._apply_state(previous_state))
         
         return True
     
@@ -97,28 +182,24 @@ class VimBuffer:
         if not self.redo_stack:
             return False
         
-        # Save current state to undo stack
-        self.save_state("Redo operation")
-        
-        # Restore next state
+        # Reapply the change, keeping its inverse for undo
         next_state = self.redo_stack.pop()
-        self.lines = next_state.lines.copy()
-        self.cursor_pos = next_state.cursor_pos
+        self.undo_stack.append(self._apply_state(next_state))
         
         return True
     
-    def get_line(self, line_num: int) -> Optional[str]:
+    def get_line(self, line_num: int) -> str:
         """Get line by number.
         
         Args:
             line_num: Line number (0-indexed)
             
         Returns:
-            Line content or None if line doesn't exist
+            Line content, or an empty string if line doesn't exist
         """
         if 0 <= line_num < len(self.lines):
             return self.lines[line_num]
-        return None
+        return ''
     
     def get_line_count(self) -> int:
         """Get total number of lines.
@@ -134,7 +215,10 @@ class VimBuffer:
         Returns:
             Complete buffer content
         """
-        return '\n'.join(self.lines)
+        # Validators read the content after every command; join only after edits
+        if self._content_cache is None:
+            self._content_cache = '\n'.join(self.lines)
+        return self._content_cache
     
     def set_content(self, content: str) -> None:
         """Set buffer content.
@@ -142,10 +226,12 @@ class VimBuffer:
         Args:
             content: New content for the buffer
         """
-        self.save_state("Set buffer content")
-        self.lines = content.split('\n') if content else ['']
+        new_lines = content.split('\n')
+        if new_lines != self.lines:
+            self._save_change(0, len(self.lines), len(new_lines), "Set buffer content")
+            self.lines = new_lines
+            self.modified = True
         self.cursor_pos = (0, 0)
-        self.modified = True
     
     def is_valid_position(self, line: int, col: int) -> bool:
         """Check if position is valid.
@@ -157,11 +243,8 @@ class VimBuffer:
         Returns:
             True if position is valid
         """
-        if line < 0 or line >= len(self.lines):
-            return False
-        
-        line_content = self.lines[line]
-        return 0 <= col <= len(line_content)
+        lines = self.lines
+        return 0 <= line < len(lines) and 0 <= col <= len(lines[line])
     
     def clamp_position(self, line: int, col: int) -> Tuple[int, int]:
         """Clamp position to valid bounds.
@@ -173,9 +256,9 @@ class VimBuffer:
         Returns:
             Clamped (line, column) position
         """
-        line = max(0, min(line, len(self.lines) - 1))
-        line_content = self.lines[line]
-        col = max(0, min(col, len(line_content)))
+        lines = self.lines
+        line = max(0, min(line, len(lines) - 1))
+        col = max(0, min(col, len(lines[line])))
         return (line, col)
     
     def move_cursor(self, direction: str, count: int = 1) -> bool:
@@ -189,29 +272,29 @@ class VimBuffer:
             True if cursor was moved, False if at boundary
         """
         line, col = self.cursor_pos
-        moved = False
-        
-        for _ in range(count):
-            if direction == 'up' and line > 0:
-                line -= 1
-                # Clamp column to line length
-                col = min(col, len(self.lines[line]))
-                moved = True
-            elif direction == 'down' and line < len(self.lines) - 1:
-                line += 1
-                # Clamp column to line length
-                col = min(col, len(self.lines[line]))
-                moved = True
-            elif direction == 'left' and col > 0:
-                col -= 1
-                moved = True
-            elif direction == 'right':
-                line_content = self.lines[line]
-                if col < len(line_content):
-                    col += 1
-                    moved = True
-        
-        self.cursor_pos = (line, col)
+        if count <= 0:
+            return False
+        
+        if direction == 'up':
+            new_line = max(0, line - count)
+            # Column is clamped by every line passed on the way
+            col = min([col, *map(len, self.lines[new_line:line])])
+        elif direction == 'down':
+            new_line = min(len(self.lines) - 1, line + count)
+            col = min([col, *map(len, self.lines[line + 1:new_line + 1])])
+        elif direction == 'left':
+            new_line = line
+            col = max(0, col - count)
+        elif direction == 'right':
+            new_line = line
+            line_length = len(self.lines[line])
+            if col < line_length:
+                col = min(line_length, col + count)
+        else:
+            return False
+        
+        moved = (new_line, col) != self.cursor_pos
+        self.cursor_pos = (new_line, col)
         return moved
     
     def move_to_position(self, line: int, col: int) -> bool:
@@ -241,40 +324,33 @@ class VimBuffer:
         if not text:
             return False
         
-        self.save_state(f"Insert text: '{text[:20]}{'...' if len(text) > 20 else ''}'")
-        
         line, col = self.cursor_pos
         current_line = self.lines[line]
+        self._save_change(
+            line, line + 1, text.count('\n') + 1,
+            f"Insert text: '{text[:20]}{'...' if len(text) > 20 else ''}'",
+            typing='\n' not in text
+        )
         
         # Handle newlines in inserted text
         if '\n' in text:
             lines_to_insert = text.split('\n')
             
-            # Split current line at cursor
-            before_cursor = current_line[:col]
-            after_cursor = current_line[col:]
-            
-            # Replace current line with first part + first inserted line
-            self.lines[line] = before_cursor + lines_to_insert[0]
+            # Split current line at cursor around the inserted lines, and
+            # put them all in place with one slice assignment
+            lines_to_insert[0] = current_line[:col] + lines_to_insert[0]
+            last_inserted = lines_to_insert[-1]
+            lines_to_insert[-1] += current_line[col:]
+            self.lines[line:line + 1] = lines_to_insert
             
-            # Insert additional lines
-            for i, line_text in enumerate(lines_to_insert[1:], 1):
-                self.lines.insert(line + i, line_text)
-            
-            # Add remaining text to last inserted line
-            if len(lines_to_insert) > 1:
-                last_line_idx = line + len(lines_to_insert) - 1
-                self.lines[last_line_idx] += after_cursor
-                
-                # Update cursor position
-                self.cursor_pos = (last_line_idx, len(lines_to_insert[-1]))
-            else:
-                self.cursor_pos = (line, col + len(text))
+            # Cursor ends after the inserted text on the last new line
+            self.cursor_pos = (line + len(lines_to_insert) - 1, len(last_inserted))
         else:
             # Simple text insertion
             new_line = current_line[:col] + text + current_line[col:]
             self.lines[line] = new_line
             self.cursor_pos = (line, col + len(text))
+            self._undo_group_pos = self.cursor_pos
         
         self.modified = True
         return True
@@ -289,14 +365,14 @@ class VimBuffer:
         current_line = self.lines[line]
         
         if col < len(current_line):
-            self.save_state("Delete character")
+            self._save_change(line, line + 1, 1, "Delete character")
             new_line = current_line[:col] + current_line[col + 1:]
             self.lines[line] = new_line
             self.modified = True
             return True
         elif line < len(self.lines) - 1:
             # At end of line, merge with next line
-            self.save_state("Join lines")
+            self._save_change(line, line + 2, 1, "Join lines")
             next_line = self.lines[line + 1]
             self.lines[line] = current_line + next_line
             del self.lines[line + 1]
@@ -314,16 +390,17 @@ class VimBuffer:
         line, col = self.cursor_pos
         
         if col > 0:
-            self.save_state("Backspace")
+            self._save_change(line, line + 1, 1, "Backspace", typing=True)
             current_line = self.lines[line]
             new_line = current_line[:col - 1] + current_line[col:]
             self.lines[line] = new_line
             self.cursor_pos = (line, col - 1)
+            self._undo_group_pos = self.cursor_pos
             self.modified = True
             return True
         elif line > 0:
             # At beginning of line, merge with previous line
-            self.save_state("Join with previous line")
+            self._save_change(line - 1, line + 1, 1, "Join with previous line")
             current_line = self.lines[line]
             previous_line = self.lines[line - 1]
             
@@ -353,10 +430,15 @@ class VimBuffer:
             line_num = self.cursor_pos[0]
         
         if 0 <= line_num < len(self.lines):
-            self.save_state(f"Delete line {line_num + 1}")
+            # Don't delete if it's the only line; an empty one is left alone
+            only_line = len(self.lines) == 1
+            if only_line and not self.lines[0]:
+                return False
+            self._save_change(
+                line_num, line_num + 1, int(only_line), f"Delete line {line_num + 1}"
+            )
             
-            # Don't delete if it's the only line
-            if len(self.lines) == 1:
+            if only_line:
                 self.lines[0] = ''
             else:
                 del self.lines[line_num]
@@ -383,9 +465,8 @@ class VimBuffer:
         Returns:
             True if line was inserted
         """
-        self.save_state("Insert line below")
-        
         line, _ = self.cursor_pos
+        self._save_change(line + 1, line + 1, 1, "Insert line below")
         self.lines.insert(line + 1, content)
         self.cursor_pos = (line + 1, len(content))
         self.modified = True
@@ -400,47 +481,53 @@ class VimBuffer:
         Returns:
             True if line was inserted
         """
-        self.save_state("Insert line above")
-        
         line, _ = self.cursor_pos
+        self._save_change(line, line, 1, "Insert line above")
         self.lines.insert(line, content)
         self.cursor_pos = (line, len(content))
         self.modified = True
         return True
     
+    def replace_line(self, line_num: int, content: str = "") -> bool:
+        """Replace the content of a line.
+        
+        Args:
+            line_num: Line to replace
+            content: New content for the line
+            
+        Returns:
+            True if line was replaced
+        """
+        if not 0 <= line_num < len(self.lines) or self.lines[line_num] == content:
+            return False
+        
+        self._save_change(line_num, line_num + 1, 1, f"Replace line {line_num + 1}")
+        self.lines[line_num] = content
+        self.modified = True
+        return True
+    
     def get_visual_selection(self) -> Optional[str]:
         """Get text in visual selection.
         
         Returns:
             Selected text or None if no selection
         """
-        if not self.visual_start or not self.visual_end:
+        visual_start, visual_end = self.visual_start, self.visual_end
+        if not visual_start or not visual_end:
             return None
         
-        start_line, start_col = self.visual_start
-        end_line, end_col = self.visual_end
-        
-        # Ensure start is before end
-        if (start_line > end_line or 
-            (start_line == end_line and start_col > end_col)):
-            start_line, start_col, end_line, end_col = end_line, end_col, start_line, start_col
+        # Ensure start is before end; positions compare as (line, column)
+        (start_line, start_col), (end_line, end_col) = sorted((visual_start, visual_end))
         
         if start_line == end_line:
             # Single line selection
             return self.lines[start_line][start_col:end_col + 1]
         else:
-            # Multi-line selection
-            selected_lines = []
-            
-            # First line (from start_col to end)
-            selected_lines.append(self.lines[start_line][start_col:])
-            
-            # Middle lines (complete lines)
-            for line_num in range(start_line + 1, end_line):
-                selected_lines.append(self.lines[line_num])
-            
-            # Last line (from beginning to end_col)
-            selected_lines.append(self.lines[end_line][:end_col + 1])
+            # Multi-line selection: partial first and last lines around
+            # the complete middle lines, which are taken as one slice
+            selected_lines = self.lines[start_line:end_line + 1]
+            selected_lines[0] = selected_lines[0][start_col:]
+            selected_lines[-1] = selected_lines[-1][:end_col + 1]
             
             return '\n'.join(selected_lines)
     
@@ -477,15 +564,22 @@ class VimBuffer:
     def restore_state(self, state: dict) -> None:
         """Restore buffer state from dictionary.
         
+        Undo history is reset, since its line ranges refer to the old text.
+        
         Args:
             state: State dictionary to restore
         """
         self.lines = state.get("lines", ['']).copy()
-        self.cursor_pos = tuple(state.get("cursor_pos", (0, 0)))
-        self.visual_start = tuple(state["visual_start"]) if state.get("visual_start") else None
-        self.visual_end = tuple(state["visual_end"]) if state.get("visual_end") else None
+        self._invalidate()
+        self.cursor_pos = _as_position(state.get("cursor_pos")) or (0, 0)
+        self.visual_start = _as_position(state.get("visual_start"))
+        self.visual_end = _as_position(state.get("visual_end"))
         self.modified = state.get("modified", False)
         self.filename = state.get("filename")
         
         # Ensure cursor position is valid
-        self.cursor_pos = self.clamp_position(*self.cursor_pos)
\ No newline at end of file
+        if not self.is_valid_position(*self.cursor_pos):
+            self.cursor_pos = self.clamp_position(*self.cursor_pos)
+        
+        self.undo_stack.clear()
+        self.save_state("Restored buffer state")
\ No newline at end of file
@@ -2,13 +2,36 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Pattern, Set, Tuple
 import re
 
+from ..utils.compat import DATACLASS_SLOTS
 from .modes import VimMode, ModeManager
 from .buffer import VimBuffer
 
 
+# A command is a bound method and the positional arguments to call it with
+_Command = Tuple[Callable, Tuple[Any, ...]]
+# Command tables list (keys, method name, arguments) and are bound per processor
+_CommandSpec = Tuple[Tuple[str, str, Tuple[Any, ...]], ...]
+
+# Basic :s/old/new/ syntax with an optional g flag
+_SUBSTITUTE_RE = re.compile(r's/([^/]*)/([^/]*)/([g]?)')
+
+# Word motions treat alphanumeric runs as words; [^\W_] matches exactly
+# the characters str.isalnum() accepts
+_WORD_RE = re.compile(r'[^\W_]+')
+_NEXT_WORD_RE = re.compile(r'[\W_]*[^\W_]*[\W_]*')
+_WORD_END_RE = re.compile(r'[\W_]*[^\W_]*')
+
+
+def _match_end(pattern: Pattern[str], text: str, pos: int) -> int:
+    """Return the column where a word pattern stops matching from ``pos``."""
+    match = pattern.match(text, pos)
+    assert match is not None  # every part of the word patterns may match empty
+    return match.end()
+
+
 class CommandType(Enum):
     """Types of Vim commands."""
     MOVEMENT = "movement"
@@ -20,7 +43,7 @@ class CommandType(Enum):
     MACRO = "macro"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CommandResult:
     """Result of command execution."""
     success: bool
@@ -35,6 +58,116 @@ class CommandResult:
 class VimCommandProcessor:
     """Processes and executes Vim commands."""
     
+    __slots__ = (
+        "buffer", "mode_manager", "command_history", "last_command", "repeat_count",
+        "pending_operator", "normal_commands", "movement_commands",
+        "text_objects", "_mode_dispatch", "awaiting_motion", "search_pattern",
+        "command_buffer", "validate_commands",
+    )
+    
+    # Normal mode commands
+    _NORMAL_COMMAND_SPEC: _CommandSpec = (
+        # Movement commands
+        ('h', '_move_cursor', ('left',)),
+        ('j', '_move_cursor', ('down',)),
+        ('k', '_move_cursor', ('up',)),
+        ('l', '_move_cursor', ('right',)),
+        
+        # Word movement
+        ('w', '_move_word', ('forward',)),
+        ('b', '_move_word', ('backward',)),
+        ('e', '_move_word', ('end',)),
+        ('W', '_move_WORD', ('forward',)),
+        ('B', '_move_WORD', ('backward',)),
+        ('E', '_move_WORD', ('end',)),
+        
+        # Line movement
+        ('0', '_move_to_line_start', ()),
+        ('^', '_move_to_first_nonblank', ()),
+        ('$', '_move_to_line_end', ()),
+        ('g_', '_move_to_last_nonblank', ()),
+        
+        # File movement
+        ('gg', '_go_to_line', (1,)),
+        ('G', '_go_to_line', (-1,)),  # Last line
+        
+        # Editing commands
+        ('x', '_delete_char', ()),
+        ('X', '_delete_char_before', ()),
+        ('dd', '_delete_line', ()),
+        ('D', '_delete_to_end_of_line', ()),
+        ('yy', '_yank_line', ()),
+        ('Y', '_yank_to_end_of_line', ()),
+        ('p', '_paste_after', ()),
+        ('P', '_paste_before', ()),
+        
+        # Change commands
+        ('cc', '_change_line', ()),
+        ('C', '_change_to_end_of_line', ()),
+        ('cw', '_change_word', ()),
+        ('s', '_substitute_char', ()),
+        ('S', '_substitute_line', ()),
+        ('r', '_replace_char_mode', ()),
+        
+        # Undo/redo
+        ('u', '_undo', ()),
+        ('\x12', '_redo', ()),  # Ctrl-R
+        
+        # Insert mode commands
+        ('i', '_insert_before', ()),
+        ('I', '_insert_at_line_start', ()),
+        ('a', '_append_after', ()),
+        ('A', '_append_at_line_end', ()),
+        ('o', '_open_line_below', ()),
+        ('O', '_open_line_above', ()),
+        
+        # Visual mode commands
+        ('v', '_visual_char', ()),
+        ('V', '_visual_line', ()),
+        ('\x16', '_visual_block', ()),  # Ctrl-V
+        
+        # Search commands
+        ('/', '_search_forward', ()),
+        ('?', '_search_backward', ()),
+        ('n', '_repeat_search', ()),
+        ('N', '_repeat_search_reverse', ()),
+        ('*', '_search_word_forward', ()),
+        ('#', '_search_word_backward', ()),
+    )
+    
+    # Proper prefixes of multi-key normal mode commands, for partial command checks
+    _COMMAND_PREFIXES = frozenset(
+        keys[:i] for keys, _, _ in _NORMAL_COMMAND_SPEC for i in range(1, len(keys))
+    )
+    
+    # Movement commands that can be used with operators
+    _MOVEMENT_COMMAND_SPEC: _CommandSpec = (
+        ('h', '_move_cursor', ('left',)),
+        ('j', '_move_cursor', ('down',)),
+        ('k', '_move_cursor', ('up',)),
+        ('l', '_move_cursor', ('right',)),
+        ('w', '_move_word', ('forward',)),
+        ('b', '_move_word', ('backward',)),
+        ('e', '_move_word', ('end',)),
+        ('0', '_move_to_line_start', ()),
+        ('^', '_move_to_first_nonblank', ()),
+        ('$', '_move_to_line_end', ()),
+    )
+    
+    # Text objects
+    _TEXT_OBJECT_SPEC: _CommandSpec = (
+        ('iw', '_text_object_inner_word', ()),
+        ('aw', '_text_object_around_word', ()),
+        ('ip', '_text_object_inner_paragraph', ()),
+        ('ap', '_text_object_around_paragraph', ()),
+        ('i"', '_text_object_inner_quotes', ('"',)),
+        ('a"', '_text_object_around_quotes', ('"',)),
+        ("i'", '_text_object_inner_quotes', ("'",)),
+        ("a'", '_text_object_around_quotes', ("'",)),
+        ('i(', '_text_object_inner_parens', ()),
+        ('a(', '_text_object_around_parens', ()),
+    )
+    
     def __init__(self, buffer: VimBuffer, mode_manager: ModeManager):
         """Initialize command processor.
         
@@ -53,112 +186,36 @@ class VimCommandProcessor:
         self.normal_commands = self._build_normal_command_map()
         self.movement_commands = self._build_movement_command_map()
         self.text_objects = self._build_text_objects()
+        self._mode_dispatch = {
+            VimMode.NORMAL: self._process_normal_mode_key,
+            VimMode.INSERT: self._process_insert_mode_key,
+            VimMode.VISUAL: self._process_visual_mode_key,
+            VimMode.VISUAL_LINE: self._process_visual_mode_key,
+            VimMode.VISUAL_BLOCK: self._process_visual_mode_key,
+            VimMode.COMMAND: self._process_command_mode_key,
+        }
         
         # Command state
         self.awaiting_motion = False
         self.search_pattern = ""
         self.command_buffer = ""
+        self.validate_commands = True  # toggled by the simulator's learning mode
     
-    def _build_normal_command_map(self) -> Dict[str, Callable]:
+    def _build_normal_command_map(self) -> Dict[str, _Command]:
         """Build map of normal mode commands."""
-        return {
-            # Movement commands
-            'h': lambda: self._move_cursor('left'),
-            'j': lambda: self._move_cursor('down'),
-            'k': lambda: self._move_cursor('up'),
-            'l': lambda: self._move_cursor('right'),
-            
-            # Word movement
-            'w': lambda: self._move_word('forward'),
-            'b': lambda: self._move_word('backward'),
-            'e': lambda: self._move_word('end'),
-            'W': lambda: self._move_WORD('forward'),
-            'B': lambda: self._move_WORD('backward'),
-            'E': lambda: self._move_WORD('end'),
-            
-            # Line movement
-            '0': lambda: self._move_to_line_start(),
-            '^': lambda: self._move_to_first_nonblank(),
-            '$': lambda: self._move_to_line_end(),
-            'g_': lambda: self._move_to_last_nonblank(),
-            
-            # File movement
-            'gg': lambda: self._go_to_line(1),
-            'G': lambda: self._go_to_line(-1),  # Last line
-            
-            # Editing commands
-            'x': lambda: self._delete_char(),
-            'X': lambda: self._delete_char_before(),
-            'dd': lambda: self._delete_line(),
-            'D': lambda: self._delete_to_end_of_line(),
-            'yy': lambda: self._yank_line(),
-            'Y': lambda: self._yank_to_end_of_line(),
-            'p': lambda: self._paste_after(),
-            'P': lambda: self._paste_before(),
-            
-            # Change commands
-            'cc': lambda: self._change_line(),
-            'C': lambda: self._change_to_end_of_line(),
-            'cw': lambda: self._change_word(),
-            's': lambda: self._substitute_char(),
-            'S': lambda: self._substitute_line(),
-            'r': lambda: self._replace_char_mode(),
-            
-            # Undo/redo
-            'u': lambda: self._undo(),
-            '\x12': lambda: self._redo(),  # Ctrl-R
-            
-            # Insert mode commands
-            'i': lambda: self._insert_before(),
-            'I': lambda: self._insert_at_line_start(),
-            'a': lambda: self._append_after(),
-            'A': lambda: self._append_at_line_end(),
-            'o': lambda: self._open_line_below(),
-            'O': lambda: self._open_line_above(),
-            
-            # Visual mode commands
-            'v': lambda: self._visual_char(),
-            'V': lambda: self._visual_line(),
-            '\x16': lambda: self._visual_block(),  # Ctrl-V
-            
-            # Search commands
-            '/': lambda: self._search_forward(),
-            '?': lambda: self._search_backward(),
-            'n': lambda: self._repeat_search(),
-            'N': lambda: self._repeat_search_reverse(),
-            '*': lambda: self._search_word_forward(),
-            '#': lambda: self._search_word_backward(),
-        }
+        return self._bind_commands(self._NORMAL_COMMAND_SPEC)
     
-    def _build_movement_command_map(self) -> Dict[str, Callable]:
+    def _build_movement_command_map(self) -> Dict[str, _Command]:
         """Build map of movement commands that can be used with operators."""
-        return {
-            'h': lambda: self._move_cursor('left'),
-            'j': lambda: self._move_cursor('down'),
-            'k': lambda: self._move_cursor('up'),
-            'l': lambda: self._move_cursor('right'),
-            'w': lambda: self._move_word('forward'),
-            'b': lambda: self._move_word('backward'),
-            'e': lambda: self._move_word('end'),
-            '0': lambda: self._move_to_line_start(),
-            '^': lambda: self._move_to_first_nonblank(),
-            '$': lambda: self._move_to_line_end(),
-        }
+        return self._bind_commands(self._MOVEMENT_COMMAND_SPEC)
     
-    def _build_text_objects(self) -> Dict[str, Callable]:
+    def _build_text_objects(self) -> Dict[str, _Command]:
         """Build map of text objects."""
-        return {
-            'iw': lambda: self._text_object_inner_word(),
-            'aw': lambda: self._text_object_around_word(),
-            'ip': lambda: self._text_object_inner_paragraph(),
-            'ap': lambda: self._text_object_around_paragraph(),
-            'i"': lambda: self._text_object_inner_quotes('"'),
-            'a"': lambda: self._text_object_around_quotes('"'),
-            "i'": lambda: self._text_object_inner_quotes("'"),
-            "a'": lambda: self._text_object_around_quotes("'"),
-            'i(': lambda: self._text_object_inner_parens(),
-            'a(': lambda: self._text_object_around_parens(),
-        }
+        return self._bind_commands(self._TEXT_OBJECT_SPEC)
+    
+    def _bind_commands(self, spec: _CommandSpec) -> Dict[str, _Command]:
+        """Build a command map from a table of (keys, method name, arguments)."""
+        return {keys: (getattr(self, name), args) for keys, name, args in spec}
     
     def process_key(self, key: str) -> CommandResult:
         """Process a single keypress.
@@ -170,21 +227,21 @@ class VimCommandProcessor:
             CommandResult with execution details
         """
         # Handle repeat count
-        if key.isdigit() and key != '0' and not self.command_buffer:
+        if not self.command_buffer and key.isdigit() and key.isascii() and key[0] != '0':
             self.repeat_count = self.repeat_count * 10 + int(key)
             return CommandResult(success=True, message=f"Count: {self.repeat_count}")
         
+        mode = self.mode_manager.current_mode
+        
+        # Only a run of typing in insert mode is undone as a single change
+        if mode != VimMode.INSERT:
+            self.buffer.break_undo_group()
+        
         # Handle mode-specific processing
-        if self.mode_manager.current_mode == VimMode.NORMAL:
-            return self._process_normal_mode_key(key)
-        elif self.mode_manager.current_mode == VimMode.INSERT:
-            return self._process_insert_mode_key(key)
-        elif self.mode_manager.is_visual_mode():
-            return self._process_visual_mode_key(key)
-        elif self.mode_manager.current_mode == VimMode.COMMAND:
-            return self._process_command_mode_key(key)
-        else:
-            return CommandResult(success=False, error=f"Mode {self.mode_manager.current_mode} not implemented")
+        handler = self._mode_dispatch.get(mode)
+        if handler is None:
+            return CommandResult(success=False, error=f"Mode {mode} not implemented")
+        return handler(key)
     
     def _process_normal_mode_key(self, key: str) -> CommandResult:
         """Process key in normal mode."""
@@ -208,7 +265,7 @@ class VimCommandProcessor:
             return result
         
         # Check for partial command
-        if any(cmd.startswith(self.command_buffer) for cmd in self.normal_commands):
+        if self.command_buffer in self._COMMAND_PREFIXES:
             return CommandResult(success=True, message=f"Partial command: {self.command_buffer}")
         
         # Invalid command
@@ -322,14 +379,19 @@ class VimCommandProcessor:
         
         return CommandResult(success=False, error=f"Cannot handle key in command mode: {repr(key)}")
     
-    def _execute_command(self, command: Callable, command_str: str) -> CommandResult:
+    def _execute_command(self, command: _Command, command_str: str) -> CommandResult:
         """Execute a command with repeat count."""
+        method, args = command
+        count = self.repeat_count
         try:
             original_pos = self.buffer.cursor_pos
             
-            # Execute command repeat_count times
-            for _ in range(self.repeat_count):
-                command()
+            # Execute command repeat_count times; most commands have no count
+            if count == 1:
+                method(*args)
+            else:
+                for _ in range(count):
+                    method(*args)
             
             # Record command in history
             self.command_history.append(command_str)
@@ -341,7 +403,7 @@ class VimCommandProcessor:
             return CommandResult(
                 success=True,
                 cursor_moved=cursor_moved,
-                message=f"Executed {command_str}" + (f" {self.repeat_count} times" if self.repeat_count > 1 else "")
+                message=f"Executed {command_str}" + (f" {count} times" if count > 1 else "")
             )
         except Exception as e:
             return CommandResult(success=False, error=str(e))
@@ -367,7 +429,7 @@ class VimCommandProcessor:
     def _execute_substitute(self, command: str) -> CommandResult:
         """Execute substitute command."""
         # Basic s/old/new/ parsing
-        match = re.match(r's/([^/]*)/([^/]*)/([g]?)', command)
+        match = _SUBSTITUTE_RE.match(command)
         if not match:
             return CommandResult(success=False, error="Invalid substitute syntax")
         
@@ -414,15 +476,10 @@ class VimCommandProcessor:
         current_line = self.buffer.get_line(line)
         
         if current_line and col < len(current_line):
-            # Find next word boundary
-            while col < len(current_line) and not current_line[col].isalnum():
-                col += 1
-            while col < len(current_line) and current_line[col].isalnum():
-                col += 1
-            while col < len(current_line) and not current_line[col].isalnum():
-                col += 1
-        
-        if col >= len(current_line or ''):
+            # Skip the rest of this word and the gap after it
+            col = _match_end(_NEXT_WORD_RE, current_line, col)
+        
+        if col >= len(current_line):
             # Move to next line
             if line < self.buffer.get_line_count() - 1:
                 self.buffer.move_to_position(line + 1, 0)
@@ -435,19 +492,19 @@ class VimCommandProcessor:
         line, col = self.buffer.cursor_pos
         
         if col > 0:
-            col -= 1
             current_line = self.buffer.get_line(line)
             
-            # Move back to word start
+            # Move back to the start of the last word before the cursor
             if current_line:
-                while col > 0 and not current_line[col].isalnum():
-                    col -= 1
-                while col > 0 and current_line[col - 1].isalnum():
-                    col -= 1
+                end, col = col, 0
+                for match in _WORD_RE.finditer(current_line, 0, end):
+                    col = match.start()
+            else:
+                col -= 1
         elif line > 0:
             # Move to end of previous line
             prev_line = self.buffer.get_line(line - 1)
-            self.buffer.move_to_position(line - 1, len(prev_line or ''))
+            self.buffer.move_to_position(line - 1, len(prev_line))
             return
         
         self.buffer.move_to_position(line, col)
@@ -459,12 +516,7 @@ class VimCommandProcessor:
         
         if current_line and col < len(current_line):
             # Move to end of current or next word
-            if not current_line[col].isalnum():
-                while col < len(current_line) and not current_line[col].isalnum():
-                    col += 1
-            
-            while col < len(current_line) and current_line[col].isalnum():
-                col += 1
+            col = _match_end(_WORD_END_RE, current_line, col)
             
             if col > 0:
                 col -= 1
@@ -479,29 +531,23 @@ class VimCommandProcessor:
     def _move_to_first_nonblank(self) -> bool:
         """Move to first non-blank character of line."""
         line, _ = self.buffer.cursor_pos
-        current_line = self.buffer.get_line(line) or ''
-        
-        col = 0
-        while col < len(current_line) and current_line[col].isspace():
-            col += 1
+        current_line = self.buffer.get_line(line)
         
+        col = len(current_line) - len(current_line.lstrip())
         return self.buffer.move_to_position(line, col)
     
     def _move_to_line_end(self) -> bool:
         """Move to end of line."""
         line, _ = self.buffer.cursor_pos
-        current_line = self.buffer.get_line(line) or ''
+        current_line = self.buffer.get_line(line)
         return self.buffer.move_to_position(line, max(0, len(current_line) - 1))
     
     def _move_to_last_nonblank(self) -> bool:
         """Move to last non-blank character of line."""
         line, _ = self.buffer.cursor_pos
-        current_line = self.buffer.get_line(line) or ''
-        
-        col = len(current_line) - 1
-        while col >= 0 and current_line[col].isspace():
-            col -= 1
+        current_line = self.buffer.get_line(line)
         
+        col = len(current_line.rstrip()) - 1
         return self.buffer.move_to_position(line, max(0, col))
     
     def _go_to_line(self, line_num: int) -> bool:
@@ -615,7 +661,7 @@ class VimCommandProcessor:
     def _substitute_line(self) -> None:
         """Substitute entire line."""
         line, _ = self.buffer.cursor_pos
-        self.buffer.lines[line] = ''
+        self.buffer.replace_line(line, '')
         self.buffer.cursor_pos = (line, 0)
         self.mode_manager.switch_mode(VimMode.INSERT)
     
@@ -0,0 +1,8 @@
+"""Compatibility helpers for the Python versions VimGym supports."""
+
+import sys
+from typing import Any, Dict
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}